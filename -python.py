@@ -1,9 +1,2 @@
-# تهيئة محول الميزات متعدد الحدود من الدرجة الثانية
-self.poly_features["poly2"] = PolynomialFeatures(degree=2)
-
-# تحويل البيانات إلى صيغة متعددة الحدود
-x_poly = self.poly_features["poly2"].fit_transform(x)
-
-# تدريب النموذج على البيانات المحولة
-self.models["poly2"] = LinearRegression()
-self.models["poly2"].fit(x_poly, y)
\ No newline at end of file
+# حل معادلات التجميع الطبيعية المحدثة تزايدياً بدلاً من إعادة ملاءمة sklearn كاملة
+self.models["poly2"] = PolyFit(self._solve_coeffs(2))
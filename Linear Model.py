@@ -1,7 +1,3 @@
-# تهيئة نموذج خطي بسيط
-self.models["linear"] = LinearRegression()
-
-# تدريب النموذج الخطي
-x = np.array(range(len(self.df))).reshape(-1, 1)  # المتغير المستقل (الزمن)
-y = np.array(self.df['Temperature'])               # المتغير التابع (درجة الحرارة)
-self.models["linear"].fit(x, y)
\ No newline at end of file
+# ملاءمة النموذج الخطي بصيغة مغلقة بدلاً من LinearRegression
+y = np.array(self.df['Temperature'])               # المتغير التابع (درجة الحرارة)
+self.models["linear"] = self._fit_linear_fast(y)   # يحسب الميل والتقاطع مباشرة
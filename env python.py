@@ -10,18 +10,87 @@ Last Updated: 2025-03-16
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import pandas as pd
 from datetime import datetime, timedelta
-import joblib
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.metrics import mean_squared_error, r2_score
+from collections import namedtuple
 import os
 import json
-import matplotlib
-matplotlib.rcParams['font.family'] = 'Arial'  # لتحسين عرض النصوص العربية إن وجدت
+import functools
+from pathlib import Path
+
+
+def _load_ml_libs():
+    """استيراد مكتبات التعلم الآلي عند أول استخدام فقط لتسريع بدء التشغيل"""
+    global joblib, r2_score
+    import joblib
+    from sklearn.metrics import r2_score
+
+
+def _load_plotting_libs():
+    """استيراد matplotlib عند إنشاء إطار الرسم لأول مرة"""
+    global matplotlib, plt, FigureCanvasTkAgg
+    import matplotlib
+    matplotlib.rcParams['font.family'] = 'Arial'  # لتحسين عرض النصوص العربية إن وجدت
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# تصنيف القراءات كفئات مرتبة ثابتة بدلاً من نصوص — يقلل الذاكرة ويسرّع المقارنات
+RATING_DTYPE = pd.CategoricalDtype(
+    ["Very Cold", "Cold", "Normal", "Warm", "Very Hot"], ordered=True
+)
+
+# حدود التصنيف بالدرجة المئوية — تُستخدم لاشتقاق التقييم اتجاهياً عبر np.digitize
+RATING_EDGES = np.array([0.0, 10.0, 25.0, 35.0])
+
+# خريطة الأنواع المضغوطة للأعمدة — تُطبق في كل مسارات الإنشاء والتحميل والاستيراد
+COLUMN_DTYPES = {'Temperature': 'float32', 'Rating': RATING_DTYPE, 'Notes': 'string'}
+
+# الأعمدة الرقمية/النصية فقط — للتمرير إلى read_csv الذي لا يقبل الفئات مباشرة
+CSV_DTYPES = {'Temperature': 'float32', 'Notes': 'string'}
+
+# الأسماء الوصفية للنماذج — ثابت وحدة بدلاً من بناء القاموس عند كل استدعاء
+MODEL_NAMES = {
+    "linear": "Linear",
+    "poly2": "Polynomial Degree 2",
+    "poly3": "Polynomial Degree 3"
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_str):
+    """تحليل تاريخ YYYY-MM-DD مع تذكر النتائج — نفس اليوم يتكرر كثيراً في الإدخال"""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(dt_str):
+    """تحليل طابع زمني YYYY-MM-DD HH:MM مع تذكر النتائج"""
+    return datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
+
+
+class LinearFit(namedtuple("LinearFit", ["alpha", "beta"])):
+    """نموذج خطي خفيف بصيغة مغلقة (alpha + beta * t) بديلاً عن LinearRegression"""
+
+    def predict(self, t):
+        t = np.asarray(t, dtype=float)
+        return self.alpha + self.beta * t.ravel()
+
+
+def _poly_eval(coef, t):
+    """تقييم كثير حدود بطريقة هورنر على مصفوفة كاملة — تمريرة واحدة لكل معامل"""
+    t = np.asarray(t, dtype=float).ravel()
+    result = np.full_like(t, coef[-1])
+    for c in coef[-2::-1]:
+        result = result * t + c
+    return result
+
+
+class PolyFit(namedtuple("PolyFit", ["coef"])):
+    """نموذج متعدد الحدود خفيف — المعاملات مرتبة من الحد الثابت فصاعداً ويقيَّم بمخطط هورنر"""
+
+    def predict(self, t):
+        return _poly_eval(self.coef, t)
+
 
 class TempMonitorSystem:
     def __init__(self, root):
@@ -34,7 +103,7 @@ class TempMonitorSystem:
         self.app_config = {
             "data_dir": "./temp_data",
             "model_file": "temp_model.pkl",
-            "history_file": "temp_history.csv",
+            "history_file": "temp_history.feather",
             "config_file": "app_config.json",
             "auto_predict": True,
             "prediction_days": 7,
@@ -44,21 +113,60 @@ class TempMonitorSystem:
         
         # تهيئة البيانات
         self.temp_data = {'Date': [], 'Time': [], 'Temperature': [], 'Rating': [], 'Notes': []}
-        self.df = pd.DataFrame(self.temp_data)
+        self.df = pd.DataFrame(self.temp_data).astype(COLUMN_DTYPES)
         
-        # تهيئة نماذج التنبؤ المتعددة
+        # تهيئة نماذج التنبؤ المتعددة (تُبنى عبر _fit_one عند التدريب أو تُستعاد من الإعدادات)
         self.models = {
-            "linear": LinearRegression(),
-            "poly2": LinearRegression(),
-            "poly3": LinearRegression()
-        }
-        
-        self.poly_features = {
-            "poly2": PolynomialFeatures(degree=2),
-            "poly3": PolynomialFeatures(degree=3)
+            "linear": None,  # يُنشأ عبر _fit_linear_fast عند التدريب
+            "poly2": None,
+            "poly3": None
         }
-        
+
         self.active_model = "poly2"  # النموذج الافتراضي
+
+        # حالة فرز الجدول على مستوى العرض فقط — لا تمس ترتيب البيانات الأصلي
+        self._sort_col = None
+        self._sort_reverse = False
+
+        # راية العمليات الجماعية — تمنع الحفظ والتحديث المتكرر أثناء الاستيراد
+        self._updating = False
+
+        # راية تأجيل تحديث العرض — تدمج الطلبات المتتالية في تحديث واحد
+        self._refresh_pending = False
+
+        # مراجع فناني الرسم المعاد استخدامها عند تغير البيانات دون تغير العرض
+        self._graph_state = None
+        self._line_artist = None
+        self._trend_artist = None
+
+        # مخزن مسبق التخصيص لدرجات الحرارة (تتضاعف سعته عند الامتلاء)
+        # يبقي العمود الرقمي متجاوراً في الذاكرة للإحصاءات والتدريب
+        self._cap = 1024
+        self._n = 0
+        self._temps = np.empty(self._cap, dtype=np.float32)
+
+        # التواريخ المحللة مسبقاً — تغني عن pd.to_datetime عند كل تصفية زمنية
+        self._dates = np.empty(self._cap, dtype='datetime64[s]')
+
+        # مجاميع جارية للإحصاءات — تحديثها O(1) عند كل قراءة جديدة
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._min = np.inf
+        self._max = -np.inf
+
+        # سجل القراءات كقائمة قواميس — الإضافة O(1) ويعاد بناء DataFrame كسولاً عند الحاجة
+        self._rows = []
+        self._df_dirty = False
+
+        # تحديثات شريط الحالة المعلقة — تُكتب دفعة واحدة عبر after_idle
+        self._pending_status = None
+        self._pending_records = None
+        self._ui_flush_scheduled = False
+
+        # خلفية الرسم المخزنة للتحديث السريع بتقنية blit (تُلغى عند تغيّر البيانات أو الحجم)
+        self._blit_bg = None
+        self._blit_key = None
+        self._resize_cid = None
         
         # إنشاء مسار لحفظ البيانات إذا لم يكن موجوداً
         if not os.path.exists(self.app_config["data_dir"]):
@@ -69,10 +177,19 @@ class TempMonitorSystem:
             
         # التحقق من وجود نماذج مدربة سابقاً
         self.load_data_and_models()
-        
+
+        # ملء المخزن الرقمي من البيانات المحملة
+        self._rebuild_caches()
+
         # إنشاء الواجهة الرئيسية
         self.create_widgets()
-        
+
+        # إعادة التدريب فوراً إذا غابت النماذج رغم توفر البيانات (كترقية من
+        # صيغة pkl القديمة) — حل المعادلات الطبيعية شبه مجاني، ويجري بعد إنشاء
+        # الواجهة لأن evaluate_models يكتب في متغيرات العرض
+        if len(self.df) >= 5 and any(m is None for m in self.models.values()):
+            self.train_all_models()
+
         # تحديث الإحصائيات والرسومات
         self.update_display()
         
@@ -102,22 +219,65 @@ class TempMonitorSystem:
     def load_data_and_models(self):
         """تحميل البيانات والنماذج المدربة"""
         history_path = os.path.join(self.app_config["data_dir"], self.app_config["history_file"])
-        
+        legacy_csv = os.path.join(self.app_config["data_dir"], "temp_history.csv")
+
+        # ترحيل لمرة واحدة من صيغة CSV القديمة إلى Feather
+        if not os.path.exists(history_path) and os.path.exists(legacy_csv):
+            try:
+                legacy_df = pd.read_csv(legacy_csv, dtype=CSV_DTYPES)
+                # التسميات خارج المستويات الخمسة يعاد اشتقاقها من درجة الحرارة
+                # بدلاً من فقدانها — الملف الأصلي يُحذف بعد الترحيل
+                legacy_df['Rating'] = self._coerce_ratings(legacy_df)
+                legacy_df['Notes'] = legacy_df['Notes'].fillna("")
+                legacy_df.to_feather(history_path)
+                os.remove(legacy_csv)
+                print("Migrated history from CSV to Feather")
+            except Exception as e:
+                # في غياب pyarrow نواصل العمل بصيغة CSV القديمة
+                print(f"Error migrating history to Feather: {e}")
+                history_path = legacy_csv
+
         # تحميل بيانات القراءات
         if os.path.exists(history_path):
             try:
-                self.df = pd.read_csv(history_path)
+                if history_path.endswith(".feather"):
+                    # قراءة ثنائية عمودية بأنواع محفوظة — بلا تحليل نصوص لكل خلية
+                    self.df = pd.read_feather(history_path)
+                else:
+                    # تثبيت الأنواع عند القراءة: float32 لدرجات الحرارة وفئات ثابتة للتقييم
+                    self.df = pd.read_csv(history_path, dtype=CSV_DTYPES)
+                    self.df['Rating'] = self._coerce_ratings(self.df)
+                    self.df['Notes'] = self.df['Notes'].fillna("")
                 print(f"Loaded {len(self.df)} readings from previous data")
             except Exception as e:
                 print(f"Error loading data: {e}")
         
-        # تحميل نماذج التنبؤ
+        # إعادة بناء النماذج من المعاملات المخزنة في الإعدادات — بلا pickle في مسار البدء
+        saved_models = self.app_config.get("models") or {}
+        for model_name, coeffs in saved_models.items():
+            if model_name not in self.models or not coeffs:
+                continue
+            if model_name == "linear":
+                self.models[model_name] = LinearFit(*coeffs)
+            else:
+                self.models[model_name] = PolyFit(np.asarray(coeffs, dtype=float))
+            print(f"Model {model_name} restored from config")
+
+        # دعم قديم: ملفات pkl من إصدارات سابقة (لا تُستورد joblib إلا عند وجودها)
         for model_name in self.models.keys():
+            if self.models[model_name] is not None:
+                continue
             model_path = os.path.join(self.app_config["data_dir"], f"{model_name}_model.pkl")
             if os.path.exists(model_path):
                 try:
-                    self.models[model_name] = joblib.load(model_path)
-                    print(f"Model {model_name} loaded successfully")
+                    _load_ml_libs()
+                    model = self._load_model(model_path)
+                    if isinstance(model, (LinearFit, PolyFit)):
+                        self.models[model_name] = model
+                        print(f"Model {model_name} loaded successfully")
+                    else:
+                        # نماذج sklearn قديمة — يعاد تدريبها من البيانات عند توفرها
+                        print(f"Ignoring legacy model format for {model_name}")
                 except Exception as e:
                     print(f"Error loading model {model_name}: {e}")
     
@@ -373,6 +533,7 @@ class TempMonitorSystem:
     
     def create_graph_frame(self, parent):
         """إنشاء إطار الرسم البياني"""
+        _load_plotting_libs()
         # ملاحظة: تنفيذ هذه الدالة مطلوب
         pass
     
@@ -1,4 +1,4 @@
-def add_reading(self):
+    def add_reading(self):
         """Add a new temperature reading to the data"""
         try:
             # Get data from input fields
@@ -14,23 +14,24 @@ def add_reading(self):
             
             # Format date and time
             try:
-                date_time = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+                date_time = _parse_datetime(f"{date_str} {time_str}")
                 date_str = date_time.strftime("%Y-%m-%d")
                 time_str = date_time.strftime("%H:%M:%S")
             except ValueError:
                 messagebox.showerror("Error", "Invalid date or time format")
                 return
             
-            # Add to DataFrame
-            new_row = pd.DataFrame({
-                'Date': [date_str], 
-                'Time': [time_str], 
-                'Temperature': [temp], 
-                'Rating': [rating],
-                'Notes': [notes]
+            # Append to the row log — O(1) instead of copying the whole
+            # DataFrame through pd.concat; self.df is rebuilt lazily on demand
+            self._rows.append({
+                'Date': date_str,
+                'Time': time_str,
+                'Temperature': temp,
+                'Rating': rating,
+                'Notes': notes
             })
-            
-            self.df = pd.concat([self.df, new_row], ignore_index=True)
+            self._df_dirty = True
+            self._append_temp(temp, date_str)
             
             # Save data
             self.save_data()
@@ -39,8 +40,8 @@ def add_reading(self):
             if len(self.df) >= 5:
                 self.train_all_models()
             
-            # Update display
-            self.update_display()
+            # Update display (coalesced to one refresh per event-loop turn)
+            self._schedule_refresh()
             
             # Show success message
             messagebox.showinfo("Added Successfully", f"Reading added: {temp}°C - {rating}")
@@ -80,14 +81,24 @@ def add_reading(self):
         
         if confirm:
             try:
+                self._materialize_df()
+
+                # Collect the (Date, Time) keys of every selected row, then
+                # drop them all with one boolean mask instead of rebuilding
+                # the DataFrame once per selected item
+                keys = set()
                 for item in selection:
                     item_values = self.tree.item(item, "values")
-                    date_str = item_values[0]
-                    time_str = item_values[1]
-                    
-                    # Delete row from DataFrame
-                    self.df = self.df[(self.df['Date'] != date_str) | (self.df['Time'] != time_str)]
-                
+                    keys.add((item_values[0], item_values[1]))
+
+                mask = np.fromiter(
+                    (pair not in keys
+                     for pair in zip(self.df['Date'], self.df['Time'])),
+                    dtype=bool, count=len(self.df))
+                self.df = self.df.loc[mask].reset_index(drop=True)
+
+                self._rebuild_caches()
+
                 # Save data after deletion
                 self.save_data()
                 
@@ -95,8 +106,8 @@ def add_reading(self):
                 if len(self.df) >= 5:
                     self.train_all_models()
                 
-                # Update display
-                self.update_display()
+                # Update display (coalesced to one refresh per event-loop turn)
+                self._schedule_refresh()
                 
                 messagebox.showinfo("Deleted", "Selected readings deleted successfully")
             except Exception as e:
@@ -121,55 +132,97 @@ def add_reading(self):
             if len(item_values) > 4:
                 self.notes_var.set(item_values[4])
     
+    def _fill_tree(self, rows, first_chunk=200, chunk=500):
+        """Fill the table incrementally so large histories don't freeze the UI"""
+        # A new fill supersedes any chunks still queued from the previous one
+        self._fill_seq = getattr(self, '_fill_seq', 0) + 1
+
+        # Call straight into Tcl: Treeview.insert spends most of its time in
+        # Python-side option marshalling, which adds up over thousands of rows
+        tk_call = self.tree.tk.call
+        w = self.tree._w
+        for values in rows[:first_chunk]:
+            tk_call(w, "insert", "", "end", "-values", values)
+
+        if len(rows) > first_chunk:
+            seq = self._fill_seq
+            self.tree.after_idle(lambda: self._fill_tree_chunk(rows, first_chunk, chunk, seq))
+
+    def _fill_tree_chunk(self, rows, start, chunk, seq):
+        """Insert one batch of pending table rows, then reschedule"""
+        if seq != self._fill_seq:
+            return
+
+        tk_call = self.tree.tk.call
+        w = self.tree._w
+        for values in rows[start:start + chunk]:
+            tk_call(w, "insert", "", "end", "-values", values)
+
+        if start + chunk < len(rows):
+            self.tree.after_idle(lambda: self._fill_tree_chunk(rows, start + chunk, chunk, seq))
+
     def filter_data(self):
         """Filter data in table by search criteria"""
         search_text = self.search_var.get().lower()
         filter_value = self.filter_var.get()
-        
+
         # Update table
         self.tree.delete(*self.tree.get_children())
-        
-        for i, row in self.df.iterrows():
-            # Check for rating filter match
-            rating_match = filter_value == "All" or row['Rating'] == filter_value
-            
-            # Check for search text match
-            search_match = True
-            if search_text:
-                row_text = f"{row['Date']} {row['Time']} {row['Temperature']} {row['Rating']} {row.get('Notes', '')}"
-                search_match = search_text in row_text.lower()
-            
-            # Add row if matches search criteria and filter
-            if rating_match and search_match:
-                self.tree.insert("", "end", values=(
-                    row['Date'], 
-                    row['Time'], 
-                    f"{row['Temperature']:.1f}°C", 
-                    row['Rating'],
-                    row.get('Notes', '')
-                ))
+
+        if self.df.empty:
+            return
+
+        # Rating filter as one vectorized mask instead of a per-row Python loop
+        if filter_value != "All":
+            mask = self.df['Rating'] == filter_value
+        else:
+            mask = pd.Series(True, index=self.df.index)
+
+        # Search across all columns via a single lowered combined string column
+        if search_text:
+            combined = (
+                self.df['Date'].astype(str) + ' '
+                + self.df['Time'].astype(str) + ' '
+                + self.df['Temperature'].astype(str) + ' '
+                + self.df['Rating'].astype(str) + ' '
+                + self.df['Notes'].fillna('').astype(str)
+            ).str.lower()
+            mask &= combined.str.contains(search_text, regex=False, na=False)
+
+        sub = self.df.loc[mask]
+
+        # Apply the view-level sort on the typed columns (numeric for
+        # Temperature, ordered categorical for Rating); the underlying
+        # DataFrame keeps its insertion order for the time-axis models
+        if self._sort_col is not None:
+            sub = sub.sort_values(self._sort_col,
+                                  ascending=not self._sort_reverse)
+
+        # Pre-format the display strings vectorized, then hand the surviving
+        # rows to the batched tree fill
+        temps = sub['Temperature'].map('{:.1f}°C'.format)
+        rows = list(zip(sub['Date'], sub['Time'], temps,
+                        sub['Rating'].astype(str), sub['Notes'].fillna('')))
+        self._fill_tree(rows)
     
     def sort_treeview(self, tree, col, reverse):
         """Sort table by selected column"""
-        # Get values from selected column
-        data = [(tree.set(item, col), item) for item in tree.get_children('')]
-        
-        # Sort data
-        data.sort(reverse=reverse)
-        
-        # Rearrange table items
-        for i, (val, item) in enumerate(data):
-            tree.move(item, '', i)
-        
+        # Record the view-level sort state and refill from the DataFrame:
+        # sorting the typed columns keeps numeric order correct (the old
+        # item-move sort compared display strings, so '9.0°C' > '10.0°C')
+        self._sort_col = col
+        self._sort_reverse = reverse
+        self.filter_data()
+
         # Toggle sort direction for next click
         tree.heading(col, command=lambda c=col: self.sort_treeview(tree, c, not reverse))
     
     def validate_input(self):
         """Validate input data"""
         try:
-            # Validate date
+            # Validate date (memoized parse — the same day recurs constantly)
             date_str = self.date_var.get()
-            datetime.strptime(date_str, "%Y-%m-%d")
+            _parse_date(date_str)
             
             # Validate time
             time_str = self.time_var.get()
@@ -190,21 +243,28 @@ def add_reading(self):
     
     def update_display(self):
         """Update data display, statistics, and graphs"""
+        if self._updating:
+            # Bulk operation in progress — one refresh happens at its end
+            return
+        self._materialize_df()
+
         # Update table
         self.filter_data()
         
         # Update readings count in status bar
         if not self.df.empty:
-            self.records_var.set(f"Readings: {len(self.df)}")
+            self._set_records(f"Readings: {len(self.df)}")
         else:
-            self.records_var.set("No readings")
+            self._set_records("No readings")
         
         # Update statistics if data exists
         if not self.df.empty:
-            self.avg_var.set(f"{self.df['Temperature'].mean():.1f}°C")
-            self.max_var.set(f"{self.df['Temperature'].max():.1f}°C")
-            self.min_var.set(f"{self.df['Temperature'].min():.1f}°C")
-            self.std_var.set(f"{self.df['Temperature'].std():.2f}°C")
+            # Single sweep over the contiguous buffer instead of four column scans
+            mean, std, mn, mx = self._compute_stats()
+            self.avg_var.set(f"{mean:.1f}°C")
+            self.max_var.set(f"{mx:.1f}°C")
+            self.min_var.set(f"{mn:.1f}°C")
+            self.std_var.set(f"{std:.2f}°C")
             
             # Update graph
             self.update_graph()
@@ -215,57 +275,136 @@ def add_reading(self):
                 self.update_extended_predictions()
         
         # Update status bar
-        self.status_var.set(f"Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._set_status(f"Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    def _set_status(self, message):
+        """Queue a status-bar update; writes are coalesced per event-loop turn"""
+        self._pending_status = message
+        self._schedule_ui_flush()
+
+    def _set_records(self, message):
+        """Queue a readings-count update; writes are coalesced per event-loop turn"""
+        self._pending_records = message
+        self._schedule_ui_flush()
+
+    def _schedule_ui_flush(self):
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._flush_ui)
+
+    def _flush_ui(self):
+        """Write all pending StringVar updates in one event-loop turn"""
+        self._ui_flush_scheduled = False
+        if self._pending_status is not None:
+            self.status_var.set(self._pending_status)
+            self._pending_status = None
+        if self._pending_records is not None:
+            self.records_var.set(self._pending_records)
+            self._pending_records = None
+
+    def _schedule_refresh(self):
+        """Queue one display refresh per event-loop turn, however often called"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the coalesced display refresh"""
+        self._refresh_pending = False
+        self.update_display()
+
+    def _invalidate_blit(self, event=None):
+        """Drop the cached graph background (e.g. after a window resize)"""
+        self._blit_bg = None
+
+    def _capture_blit_state(self):
+        """Cache the rendered background so unchanged refreshes can blit"""
+        try:
+            self._blit_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+            # The date is part of the key because the relative periods
+            # ("Last 7 Days" etc.) move with the clock, not just the data
+            self._blit_key = (self.plot_type_var.get(), self.period_var.get(),
+                              self.active_model, datetime.now().date(), self._n)
+            if self._resize_cid is None:
+                self._resize_cid = self.canvas.mpl_connect('resize_event', self._invalidate_blit)
+        except Exception:
+            self._blit_bg = None
+
     def update_graph(self):
         """Update graph based on current data and settings"""
+        # Blit fast path: when the data and view settings are unchanged the
+        # cached background plus the existing line artists are pixel-identical,
+        # so skip the full axes rebuild (ticks, spines, legend layout)
+        if (self._blit_bg is not None and
+                self._blit_key == (self.plot_type_var.get(), self.period_var.get(),
+                                   self.active_model, datetime.now().date(), self._n)):
+            try:
+                self.canvas.restore_region(self._blit_bg)
+                for artist in self.ax.lines:
+                    self.ax.draw_artist(artist)
+                self.canvas.blit(self.ax.bbox)
+                return
+            except Exception:
+                self._blit_bg = None
+
+        plot_type = self.plot_type_var.get()
+
+        # Artist-reuse path: the view is still a Line plot of the same model,
+        # only the data changed — push the new arrays into the existing
+        # artists and rescale, skipping the clear/replot/legend rebuild
+        if (self._graph_state == (plot_type, self.active_model) and
+                plot_type == "Line" and self._line_artist is not None and
+                len(self.df) > 0):
+            filtered_df = self.filter_by_period(self.df)
+            if len(filtered_df) > 0:
+                filtered_df = filtered_df.sort_values(by=['Date', 'Time'])
+                idx = self._time_axis(len(filtered_df))
+                temps = filtered_df['Temperature'].to_numpy()
+
+                self._line_artist.set_data(idx, temps)
+                if self._trend_artist is not None and len(filtered_df) >= 3:
+                    trend = self._trend_data(filtered_df, temps)
+                    if trend is not None:
+                        self._trend_artist.set_data(*trend)
+                self._set_date_ticks(filtered_df, idx)
+
+                self.ax.relim()
+                self.ax.autoscale_view()
+                self.canvas.draw_idle()
+                self._blit_bg = None  # background is stale until the idle draw
+                return
+
         self.ax.clear()
-        
+        self._line_artist = None
+        self._trend_artist = None
+        self._graph_state = None
+
         if len(self.df) > 0:
-            # Apply period filtering
-            filtered_df = self.filter_by_period(self.df.copy())
-            
+            # Apply period filtering — filter_by_period never mutates its
+            # input, so there is no defensive copy of the whole DataFrame
+            filtered_df = self.filter_by_period(self.df)
+
             if len(filtered_df) > 0:
-                # Create numerical index for date/time
+                # Sort the (already filtered) view and pull plain arrays once;
+                # the positional index lives in a local instead of a column
                 filtered_df = filtered_df.sort_values(by=['Date', 'Time'])
-                filtered_df['index'] = range(len(filtered_df))
-                
+                idx = self._time_axis(len(filtered_df))
+                temps = filtered_df['Temperature'].to_numpy()
+
                 # Plot data based on selected plot type
-                plot_type = self.plot_type_var.get()
-                
                 if plot_type == "Line":
-                    self.ax.plot(filtered_df['index'], filtered_df['Temperature'], 'o-', color='#3498db', label='Temperature')
+                    self._line_artist = self.ax.plot(idx, temps, 'o-', color='#3498db', label='Temperature')[0]
                 elif plot_type == "Scatter":
-                    self.ax.scatter(filtered_df['index'], filtered_df['Temperature'], color='#2ecc71', s=50, label='Temperature')
+                    self.ax.scatter(idx, temps, color='#2ecc71', s=50, label='Temperature')
                 elif plot_type == "Bar":
-                    self.ax.bar(filtered_df['index'], filtered_df['Temperature'], color='#9b59b6', alpha=0.7, label='Temperature')
+                    self.ax.bar(idx, temps, color='#9b59b6', alpha=0.7, label='Temperature')
                 
                 # Add trend line if enough data is available
                 if len(filtered_df) >= 3 and plot_type != "Bar":
-                    x = np.array(filtered_df['index']).reshape(-1, 1)
-                    y = np.array(filtered_df['Temperature'])
-                    
-                    x_line = np.linspace(min(x), max(x) + 5, 100).reshape(-1, 1)
-                    
-                    # Use active model for prediction
-                    model = self.models[self.active_model]
-                    
-                    try:
-                        if self.active_model == "linear":
-                            model.fit(x, y)
-                            y_line = model.predict(x_line)
-                        else:
-                            # Use polynomial features
-                            poly = self.poly_features[self.active_model]
-                            x_poly = poly.fit_transform(x)
-                            model.fit(x_poly, y)
-                            x_line_poly = poly.transform(x_line)
-                            y_line = model.predict(x_line_poly)
-                        
-                        self.ax.plot(x_line, y_line, '--', color='#e74c3c', 
-                                    label=f'Trend ({self.get_model_name(self.active_model)})')
-                    except Exception as e:
-                        print(f"Error plotting trend line: {e}")
+                    trend = self._trend_data(filtered_df, temps)
+                    if trend is not None:
+                        self._trend_artist = self.ax.plot(*trend, '--', color='#e74c3c',
+                                    label=f'Trend ({self.get_model_name(self.active_model)})')[0]
                 
                 # Customize appearance
                 self.ax.set_xlabel('Time Sequence')
@@ -275,28 +414,70 @@ def add_reading(self):
                 self.ax.legend()
                 
                 # Display dates for x-axis
-                if len(filtered_df) > 10:
-                    step = len(filtered_df) // 5
-                    ticks_loc = filtered_df['index'][::step].tolist()
-                    ticks_labels = filtered_df['Date'][::step].tolist()
-                    self.ax.set_xticks(ticks_loc)
-                    self.ax.set_xticklabels(ticks_labels, rotation=45)
-                else:
-                    self.ax.set_xticks(filtered_df['index'])
-                    self.ax.set_xticklabels(filtered_df['Date'], rotation=45)
+                self._set_date_ticks(filtered_df, idx)
                 
-                # Add rating as different colors if plot type is scatter
+                # Add rating as different colors if plot type is scatter:
+                # map the categorical codes through a palette array and draw
+                # one scatter call instead of one per rating
                 if plot_type == "Scatter":
                     colors = {'Very Cold': '#3498db', 'Cold': '#87cefa', 'Normal': '#2ecc71', 'Warm': '#f39c12', 'Very Hot': '#e74c3c'}
-                    for rating in colors.keys():
-                        mask = filtered_df['Rating'] == rating
-                        if mask.any():
-                            self.ax.scatter(filtered_df.loc[mask, 'index'], filtered_df.loc[mask, 'Temperature'], 
-                                        color=colors[rating], s=50, label=f'Rating: {rating}')
+                    ratings = pd.Categorical(filtered_df['Rating'],
+                                             categories=list(colors))
+                    codes = ratings.codes
+                    valid = codes >= 0
+                    if valid.any():
+                        palette = np.array(list(colors.values()))
+                        self.ax.scatter(idx[valid], temps[valid],
+                                        c=palette[codes[valid]], s=50)
+                        # Proxy artists keep the per-rating legend entries
+                        present = np.unique(codes[valid])
+                        for code in present:
+                            rating = ratings.categories[code]
+                            self.ax.scatter([], [], color=colors[rating], s=50,
+                                            label=f'Rating: {rating}')
         
         # Update plot
+        self._graph_state = (plot_type, self.active_model)
         self.fig.tight_layout()
         self.canvas.draw()
+
+        # Remember this rendering for subsequent blitted refreshes
+        self._capture_blit_state()
+
+    def _trend_data(self, filtered_df, temps):
+        """Compute the trend-line arrays for the current model, or None on failure"""
+        try:
+            # Reuse the cached global model rather than refitting on every
+            # redraw; it is defined on the global time index, so evaluate it
+            # at the original row positions (plus a short extension) and
+            # plot at the local ones
+            model = self.models[self.active_model]
+            if model is None:
+                # Not trained yet — one closed-form fit on the window
+                if self.active_model == "linear":
+                    model = self._fit_linear_fast(temps)
+                else:
+                    degree = 2 if self.active_model == "poly2" else 3
+                    model = self._fit_poly_fast(temps, degree)
+                t_line = np.arange(len(filtered_df) + 5, dtype=float)
+            else:
+                gpos = filtered_df.index.to_numpy(dtype=float)
+                t_line = np.concatenate([gpos, gpos[-1] + np.arange(1.0, 6.0)])
+            x_line = np.arange(len(filtered_df) + 5)
+            return x_line, model.predict(t_line)
+        except Exception as e:
+            print(f"Error plotting trend line: {e}")
+            return None
+
+    def _set_date_ticks(self, filtered_df, idx):
+        """Label the x-axis with dates, thinned to five ticks for long ranges"""
+        if len(filtered_df) > 10:
+            step = len(filtered_df) // 5
+            self.ax.set_xticks(idx[::step])
+            self.ax.set_xticklabels(filtered_df['Date'][::step].tolist(), rotation=45)
+        else:
+            self.ax.set_xticks(idx)
+            self.ax.set_xticklabels(filtered_df['Date'], rotation=45)
     
     def filter_by_period(self, df):
         """Filter data by selected time period"""
@@ -304,82 +485,239 @@ def add_reading(self):
         
         if period == "All" or df.empty:
             return df
-        
-        # Convert date column to datetime type
-        df['datetime'] = pd.to_datetime(df['Date'])
-        
+
         # Determine start date based on selected period
         now = datetime.now()
-        
+
         if period == "Last 7 Days":
             start_date = now - timedelta(days=7)
         elif period == "Last 30 Days":
             start_date = now - timedelta(days=30)
         elif period == "Last 90 Days":
             start_date = now - timedelta(days=90)
-        
-        # Filter data
-        filtered_df = df[df['datetime'] >= start_date]
-        
-        # Remove temporary column
-        filtered_df = filtered_df.drop(columns=['datetime'])
-        
-        return filtered_df
+
+        # Compare against the pre-parsed datetime64 cache kept alongside the
+        # temperature buffer; no per-call pd.to_datetime or temporary column
+        mask = self._dates[:self._n] >= np.datetime64(start_date)
+        return df.loc[mask]
     
+    @staticmethod
+    def _time_axis(n, _cache=[np.empty(0, dtype=np.float32)]):
+        """Return the cached 0..n-1 time axis, growing the pool in powers of two"""
+        if _cache[0].size < n:
+            size = 1 << max(10, int(np.ceil(np.log2(n))))
+            _cache[0] = np.arange(size, dtype=np.float32)
+        return _cache[0][:n]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _design_matrix(degree, n):
+        """Build and memoize the polynomial design matrix for time index 0..n-1"""
+        t = np.arange(n, dtype=float)
+        matrix = np.empty((n, degree + 1))
+        matrix[:, 0] = 1.0
+        matrix[:, 1] = t
+        if degree >= 2:
+            # Straight-line fills for the two degrees the app actually uses
+            np.multiply(t, t, out=matrix[:, 2])
+        if degree == 3:
+            np.multiply(matrix[:, 2], t, out=matrix[:, 3])
+        elif degree > 3:
+            for k in range(3, degree + 1):
+                np.multiply(matrix[:, k - 1], t, out=matrix[:, k])
+        return matrix
+
+    def _append_temp(self, temp, date_str=None):
+        """Append one reading to the pre-allocated temperature buffer (amortized O(1))"""
+        if self._n == self._cap:
+            self._cap *= 2
+            self._temps = np.resize(self._temps, self._cap)
+            self._dates = np.resize(self._dates, self._cap)
+        self._temps[self._n] = temp
+        if date_str is not None:
+            self._dates[self._n] = np.datetime64(date_str)
+
+        # Running statistics — constant work per reading
+        v = float(temp)
+        self._sum += v
+        self._sumsq += v * v
+        if v < self._min:
+            self._min = v
+        if v > self._max:
+            self._max = v
+
+        # O(d^2) update of the normal equations: no need to revisit history
+        t = float(self._n)
+        phi = np.array([1.0, t, t * t, t * t * t])
+        self._XtX += np.outer(phi, phi)
+        self._Xty += phi * temp
+
+        self._n += 1
+
+    def _materialize_df(self):
+        """Rebuild self.df from the row log if appends are pending"""
+        if self._df_dirty:
+            self.df = pd.DataFrame(
+                self._rows, columns=['Date', 'Time', 'Temperature', 'Rating', 'Notes']
+            ).astype(COLUMN_DTYPES)
+            self._df_dirty = False
+
+    def _rebuild_caches(self):
+        """Rebuild the temperature buffer, row log and accumulators after bulk changes"""
+        self._rows = self.df.to_dict('records')
+        self._df_dirty = False
+        self._n = len(self.df)
+        while self._cap < self._n:
+            self._cap *= 2
+        self._temps = np.empty(self._cap, dtype=np.float32)
+        self._dates = np.empty(self._cap, dtype='datetime64[s]')
+        if self._n:
+            self._temps[:self._n] = self.df['Temperature'].to_numpy(dtype=np.float32)
+            self._dates[:self._n] = pd.to_datetime(self.df['Date']).to_numpy()
+
+        # Recompute the running statistics in one float64 pass; afterwards
+        # they are maintained incrementally by _append_temp
+        if self._n:
+            x = self._temps[:self._n].astype(np.float64)
+            self._sum = x.sum()
+            self._sumsq = np.dot(x, x)
+            self._min = x.min()
+            self._max = x.max()
+        else:
+            self._sum = 0.0
+            self._sumsq = 0.0
+            self._min = np.inf
+            self._max = -np.inf
+
+        # Normal-equation accumulators for degree 3; lower degrees are the
+        # leading sub-blocks, so one pair serves all three models
+        if self._n:
+            M = self._design_matrix(3, self._n)
+            y = self._temps[:self._n].astype(np.float64)
+            self._XtX = M.T @ M
+            self._Xty = M.T @ y
+        else:
+            self._XtX = np.zeros((4, 4))
+            self._Xty = np.zeros(4)
+
+    def _solve_coeffs(self, degree):
+        """Solve the cached normal equations for the given polynomial degree"""
+        d = degree + 1
+        return np.linalg.solve(self._XtX[:d, :d], self._Xty[:d])
+
+    @classmethod
+    def _fit_poly_fast(cls, y, degree):
+        """Fit a polynomial on the 0..n-1 time axis via the normal equations"""
+        y = np.asarray(y, dtype=float)
+        M = cls._design_matrix(degree, len(y))
+        return PolyFit(np.linalg.solve(M.T @ M, M.T @ y))
+
+    @staticmethod
+    def _validate_temps(temps):
+        """Return the index of the first NaN or out-of-range temperature, or -1"""
+        t = np.asarray(temps, dtype=float)
+        # NaN fails both comparisons, so one combined mask catches it too
+        bad = np.flatnonzero(~((t >= -50) & (t <= 60)))
+        return int(bad[0]) if bad.size else -1
+
+    @classmethod
+    def _coerce_ratings(cls, df):
+        """Cast Rating to the fixed levels, rederiving off-list labels from the temperature"""
+        # Detect unknown labels up front: casting them through the categorical
+        # dtype is deprecated in pandas and about to raise
+        known = df['Rating'].isin(RATING_DTYPE.categories).to_numpy()
+        ratings = df['Rating'].where(known).astype(RATING_DTYPE)
+        if not known.all():
+            derived = cls._classify_temps(df.loc[~known, 'Temperature'])
+            ratings[~known] = np.asarray(derived)
+        return ratings
+
+    @staticmethod
+    def _classify_temps(temps):
+        """Derive ratings from temperatures in one vectorized pass (no per-row branches)"""
+        codes = np.digitize(np.asarray(temps, dtype=float), RATING_EDGES)
+        return pd.Categorical.from_codes(codes, dtype=RATING_DTYPE)
+
+    def _compute_stats(self):
+        """Return mean/std/min/max from the O(1) running accumulators"""
+        n = self._n
+        mean = self._sum / n
+        var = self._sumsq / n - mean * mean
+        if n > 1:
+            var *= n / (n - 1)  # sample variance, matching DataFrame.std()
+        std = np.sqrt(max(var, 0.0))
+        return (mean, std, self._min, self._max)
+
+    @staticmethod
+    def _load_model(path):
+        """Load a legacy pickled model, memory-mapping its coefficient arrays"""
+        return joblib.load(path, mmap_mode='r')
+
+    @classmethod
+    def _fit_linear_fast(cls, y):
+        """Fit the linear model in closed form on the 0..n-1 time axis"""
+        y = np.asarray(y, dtype=float)
+        n = len(y)
+        t_mean = (n - 1) / 2.0
+        t_var = (n * n - 1) / 12.0  # variance of 0..n-1
+        beta = ((cls._time_axis(n) - t_mean) * (y - y.mean())).sum() / (n * t_var)
+        alpha = y.mean() - beta * t_mean
+        return LinearFit(alpha, beta)
+
+    def _fit_one(self, model_name, degree):
+        """Fit a single named model from the shared normal-equation accumulators"""
+        coeffs = self._solve_coeffs(degree)
+        if model_name == "linear":
+            return LinearFit(*coeffs)
+        return PolyFit(coeffs)
+
     def train_all_models(self):
         """Train all prediction models using available data"""
         try:
+            self._materialize_df()
             if len(self.df) >= 5:
-                # Convert data to suitable format for training
-                x = np.array(range(len(self.df))).reshape(-1, 1)
-                y = np.array(self.df['Temperature'])
-                
-                # Train linear model
-                self.models["linear"].fit(x, y)
-                
-                # Train polynomial models
-                for model_name in ["poly2", "poly3"]:
-                    poly = self.poly_features[model_name]
-                    x_poly = poly.fit_transform(x)
-                    self.models[model_name].fit(x_poly, y)
-                
-                # Save models
-                for model_name, model in self.models.items():
-                    model_path = os.path.join(self.app_config["data_dir"], f"{model_name}_model.pkl")
-                    joblib.dump(model, model_path)
+                _load_ml_libs()  # r2_score is still used for model evaluation
+
+                # Solve the incrementally maintained normal equations instead of
+                # refitting over the whole history — O(d^2) work regardless of n.
+                # All three models share the same accumulators, so "training"
+                # is three tiny independent solves
+                for model_name, degree in [("linear", 1), ("poly2", 2), ("poly3", 3)]:
+                    self.models[model_name] = self._fit_one(model_name, degree)
+
+                # Persist the coefficients into the app config — a handful of
+                # floats does not justify pickle machinery and three extra files
+                self.app_config["models"] = {
+                    name: [float(c) for c in np.ravel(list(model))]
+                    for name, model in self.models.items()
+                }
+                self.save_config()
                 
-                # Evaluate models accuracy and determine best model
-                self.evaluate_models(x, y)
+                # Evaluate models accuracy and determine best model — the float32
+                # buffer slice is passed as-is, no float64 copy of the history
+                t = self._time_axis(self._n)
+                y = self._temps[:self._n]
+                self.evaluate_models(t, y)
                 
                 print("All models trained and saved successfully")
-                self.status_var.set("Models trained successfully")
+                self._set_status("Models trained successfully")
             else:
                 messagebox.showinfo("Alert", "At least 5 readings required for accurate prediction")
-                self.status_var.set("Insufficient readings for training")
+                self._set_status("Insufficient readings for training")
         except Exception as e:
             print(f"Error training models: {e}")
-            self.status_var.set(f"Error training models")
+            self._set_status(f"Error training models")
     
-    def evaluate_models(self, x, y):
+    def evaluate_models(self, t, y):
         """Evaluate model performance and select the best one"""
         best_score = -1
         best_model = None
-        
-        # Calculate accuracy for each model
+
+        # Calculate accuracy for each model (all models share the predict(t) interface)
         scores = {}
-        
-        # Evaluate linear model
-        y_pred = self.models["linear"].predict(x)
-        r2 = r2_score(y, y_pred)
-        scores["linear"] = r2
-        
-        # Evaluate polynomial models
-        for model_name in ["poly2", "poly3"]:
-            poly = self.poly_features[model_name]
-            x_poly = poly.transform(x)
-            y_pred = self.models[model_name].predict(x_poly)
-            r2 = r2_score(y, y_pred)
-            scores[model_name] = r2
+        for model_name in ["linear", "poly2", "poly3"]:
+            y_pred = self.models[model_name].predict(t)
+            scores[model_name] = r2_score(y, y_pred)
         
         # Determine best model
         for model_name, score in scores.items():
@@ -398,19 +736,19 @@ def add_reading(self):
         """Update temperature prediction for next reading"""
         try:
             if len(self.df) >= 5:
-                # Predict next reading using active model
-                next_idx = len(self.df)
-                next_x = np.array([[next_idx]])
-                
                 model = self.models[self.active_model]
-                
-                if self.active_model == "linear":
-                    pred = model.predict(next_x)[0]
-                else:
-                    poly = self.poly_features[self.active_model]
-                    next_x_poly = poly.transform(next_x)
-                    pred = model.predict(next_x_poly)[0]
-                
+                if model is None:
+                    # Nothing trained yet — show the placeholder quietly
+                    # instead of raising a modal error on every refresh
+                    self.pred_var.set("-- °C")
+                    return None
+
+                # Predict next reading using active model; LinearFit and
+                # PolyFit evaluate directly on the scalar time index, no
+                # (1, 1) feature array needed
+                next_idx = len(self.df)
+                pred = model.predict(next_idx)[0]
+
                 # Update prediction display
                 self.pred_var.set(f"{pred:.1f}°C")
                 
@@ -424,6 +762,12 @@ def add_reading(self):
             print(f"Prediction error: {e}")
             return None
     
+    def predict_future(self, days):
+        """Predict the next `days` readings with one vectorized Horner evaluation"""
+        n = len(self.df)
+        t = self._time_axis(n + days)[n:]
+        return self.models[self.active_model].predict(t)
+
     def update_extended_predictions(self):
         """Update future predictions for multiple days"""
         try:
@@ -438,33 +782,23 @@ def add_reading(self):
             if len(self.df) < 5:
                 messagebox.showinfo("Alert", "At least 5 readings required for accurate prediction")
                 return
-            
+
+            if self.models[self.active_model] is None:
+                # Nothing trained yet — leave the table empty quietly
+                return
+
             # Get last date in data
             last_date = pd.to_datetime(self.df['Date'].iloc[-1])
-            
-            model = self.models[self.active_model]
-            
-            # Predict for each day
-            for i in range(1, days + 1):
-                next_idx = len(self.df) + i - 1
-                next_x = np.array([[next_idx]])
-                
-                # Predict using appropriate model
-                if self.active_model == "linear":
-                    pred = model.predict(next_x)[0]
-                else:
-                    poly = self.poly_features[self.active_model]
-                    next_x_poly = poly.transform(next_x)
-                    pred = model.predict(next_x_poly)[0]
-                
-                # Calculate date
-                pred_date = last_date + timedelta(days=i)
-                date_str = pred_date.strftime("%Y-%m-%d")
-                
-                # Calculate confidence (simplified)
-                confidence = max(0, 1 - (i * 0.05))
-                
-                # Add to predictions table
+
+            # One vectorized evaluation for the whole horizon instead of a
+            # model call per day; dates and confidences are also built as
+            # whole arrays rather than recomputed inside the loop
+            preds = self.predict_future(days)
+            horizon = np.arange(1, days + 1)
+            dates = (last_date + pd.to_timedelta(horizon, unit='D')).strftime("%Y-%m-%d")
+            confidences = np.maximum(0.0, 1.0 - horizon * 0.05)
+
+            for date_str, pred, confidence in zip(dates, preds, confidences):
                 self.pred_tree.insert("", "end", values=(
                     date_str,
                     f"{pred:.1f}°C",
@@ -486,23 +820,27 @@ def add_reading(self):
     
     def get_model_name(self, model_key):
         """Get descriptive name for model"""
-        models_names = {
-            "linear": "Linear",
-            "poly2": "Polynomial Degree 2",
-            "poly3": "Polynomial Degree 3"
-        }
-        return models_names.get(model_key, model_key)
+        return MODEL_NAMES.get(model_key, model_key)
     
     def save_data(self):
-        """Save data to CSV file"""
+        """Save data to the history file (Feather, with CSV fallback)"""
+        if self._updating:
+            # Bulk operation in progress — one save happens at its end
+            return
         try:
+            self._materialize_df()
             # Ensure directory exists
             if not os.path.exists(self.app_config["data_dir"]):
                 os.makedirs(self.app_config["data_dir"])
-            
-            # Save data
+
+            # Save data — columnar binary write, typed, no per-cell formatting
             path = os.path.join(self.app_config["data_dir"], self.app_config["history_file"])
-            self.df.to_csv(path, index=False)
+            try:
+                self.df.reset_index(drop=True).to_feather(path)
+            except ImportError:
+                # pyarrow not installed — fall back to the legacy CSV format
+                path = os.path.join(self.app_config["data_dir"], "temp_history.csv")
+                self.df.to_csv(path, index=False)
             print("Data saved successfully")
         except Exception as e:
             print(f"Error saving data: {e}")
@@ -510,6 +848,7 @@ def add_reading(self):
     
     def export_data(self):
         """Export data to CSV file"""
+        self._materialize_df()
         if self.df.empty:
             messagebox.showinfo("Alert", "No data to export")
             return
@@ -538,29 +877,78 @@ def add_reading(self):
             )
             
             if file_path:
-                # Check file format
-                imported_df = pd.read_csv(file_path)
-                
-                # Check for required columns
-                required_columns = ['Date', 'Time', 'Temperature', 'Rating']
-                if not all(col in imported_df.columns for col in required_columns):
-                    messagebox.showerror("Error", "Imported file does not contain required columns")
-                    return
-                
-                # Ask user about import method
-                response = messagebox.askyesno("Confirm Import", 
-                                              "Do you want to replace current data?\n(Choose 'No' to merge data)")
-                
-                if response:
-                    # Replace data
-                    self.df = imported_df
-                else:
-                    # Merge data
-                    self.df = pd.concat([self.df, imported_df], ignore_index=True)
-                    
-                    # Remove potential duplicates
-                    self.df = self.df.drop_duplicates(subset=['Date', 'Time'], keep='last')
-                
+                # Guard the whole mutation phase: while the dialogs below pump
+                # the event loop, any triggered save_data/update_display is a
+                # no-op, leaving exactly one save/train/refresh at the end
+                self._updating = True
+                try:
+                    # Stream the file in fixed-size chunks with pinned dtypes: bounded
+                    # memory, no dtype-inference pass, and the UI stays responsive
+                    chunks = []
+                    for chunk in pd.read_csv(
+                            file_path,
+                            chunksize=4096,
+                            dtype=CSV_DTYPES):
+                        chunks.append(chunk)
+                        self.root.update_idletasks()
+
+                    if not chunks:
+                        messagebox.showerror("Error", "Imported file contains no data")
+                        return
+                    imported_df = pd.concat(chunks, ignore_index=True)
+
+                    # Check for required columns with one set difference
+                    missing = {'Date', 'Time', 'Temperature'} - set(imported_df.columns)
+                    if missing:
+                        messagebox.showerror("Error", "Imported file does not contain required columns")
+                        return
+
+                    # Reject bad readings before they enter the history —
+                    # one vectorized range/NaN check over the whole column
+                    bad = self._validate_temps(imported_df['Temperature'].to_numpy())
+                    if bad != -1:
+                        messagebox.showerror("Error",
+                                             f"Invalid temperature at row {bad + 1} "
+                                             "(valid range -50 to 60 degrees Celsius)")
+                        return
+
+                    # Derive missing ratings from the temperatures via the binned classifier
+                    if 'Rating' not in imported_df.columns:
+                        imported_df['Rating'] = self._classify_temps(imported_df['Temperature'])
+                    else:
+                        imported_df['Rating'] = self._coerce_ratings(imported_df)
+                    # Notes is optional in the file but the display paths
+                    # read it unconditionally — always materialize the column
+                    if 'Notes' in imported_df.columns:
+                        imported_df['Notes'] = imported_df['Notes'].fillna("")
+                    else:
+                        imported_df['Notes'] = pd.Series("", index=imported_df.index,
+                                                         dtype='string')
+
+                    # Ask user about import method
+                    self._materialize_df()
+                    response = messagebox.askyesno("Confirm Import",
+                                                  "Do you want to replace current data?\n(Choose 'No' to merge data)")
+
+                    if response:
+                        # Replace data
+                        self.df = imported_df
+                    else:
+                        # Merge: anti-join on the (Date, Time) key set so only
+                        # genuinely new rows are appended, instead of concatenating
+                        # everything and de-duplicating the combined frame
+                        existing_keys = set(zip(self.df['Date'], self.df['Time']))
+                        new_mask = np.fromiter(
+                            (pair not in existing_keys
+                             for pair in zip(imported_df['Date'], imported_df['Time'])),
+                            dtype=bool, count=len(imported_df))
+                        self.df = pd.concat([self.df, imported_df.loc[new_mask]],
+                                            ignore_index=True)
+
+                    self._rebuild_caches()
+                finally:
+                    self._updating = False
+
                 # Save imported data
                 self.save_data()
                 
@@ -568,8 +956,8 @@ def add_reading(self):
                 if len(self.df) >= 5:
                     self.train_all_models()
                 
-                # Update display
-                self.update_display()
+                # Update display (coalesced to one refresh per event-loop turn)
+                self._schedule_refresh()
                 
                 messagebox.showinfo("Import Complete", f"Successfully imported {len(imported_df)} readings")
         except Exception as e:
@@ -586,21 +974,30 @@ def add_reading(self):
             try:
                 # Reset data
                 self.df = pd.DataFrame(self.temp_data)
+                self._rebuild_caches()
                 
-                # Reset models
+                # Reset models (refitted from the accumulators on next training)
                 self.models = {
-                    "linear": LinearRegression(),
-                    "poly2": LinearRegression(),
-                    "poly3": LinearRegression()
+                    "linear": None,
+                    "poly2": None,
+                    "poly3": None
                 }
+                self._design_matrix.cache_clear()  # release the cached matrices
+
+                # Drop the persisted coefficients too, or the next startup
+                # would restore models trained on the deleted data
+                self.app_config.pop("models", None)
+                self.save_config()
+
+                # Delete stored files — glob the known suffixes instead of
+                # string-testing every directory entry
+                data_dir = Path(self.app_config["data_dir"])
+                for path in (*data_dir.glob("*.csv"), *data_dir.glob("*.pkl"),
+                             *data_dir.glob("*.feather")):
+                    path.unlink(missing_ok=True)
                 
-                # Delete stored files
-                for file_name in os.listdir(self.app_config["data_dir"]):
-                    if file_name.endswith(".csv") or file_name.endswith(".pkl"):
-                        os.remove(os.path.join(self.app_config["data_dir"], file_name))
-                
-                # Update display
-                self.update_display()
+                # Update display (coalesced to one refresh per event-loop turn)
+                self._schedule_refresh()
                 
                 # Clear input fields
                 self.clear_input_fields()